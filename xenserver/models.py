@@ -12,6 +12,15 @@ class Zone(models.Model):
         return self.__unicode().encode('utf-8', 'replace')
 
 
+class XenServerQuerySet(models.QuerySet):
+    def with_zone(self):
+        """
+        Fetch each server's zone in the same query, for callers that touch
+        server.zone on every row.
+        """
+        return self.select_related('zone')
+
+
 class XenServer(models.Model):
     hostname = models.CharField(max_length=255, unique=True)
     username = models.CharField(max_length=255)
@@ -29,6 +38,8 @@ class XenServer(models.Model):
 
     active = models.BooleanField(default=True)
 
+    objects = XenServerQuerySet.as_manager()
+
     def __unicode__(self):
         return self.hostname
 
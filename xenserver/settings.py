@@ -116,6 +116,10 @@ CELERYBEAT_SCHEDULE = {
     'update-servers': {
         'task': 'xenserver.tasks.updateVms',
         'schedule': datetime.timedelta(seconds=60)
+    },
+    'clear-sessions': {
+        'task': 'xenserver.tasks.clearSessions',
+        'schedule': datetime.timedelta(hours=1)
     }
 }
 
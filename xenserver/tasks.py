@@ -7,6 +7,7 @@ from uuid import uuid4
 
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.management import call_command
 from lxml import etree
 
 import xenapi
@@ -306,11 +307,18 @@ def updateServer(xenserver):
 
 @app.task(time_limit=60)
 def updateVms():
-    servers = XenServer.objects.all()
+    servers = XenServer.objects.with_zone()
     for xenserver in servers:
         updateServer.delay(xenserver)
 
 
+@app.task(time_limit=300)
+def clearSessions():
+    # Expired sessions are never removed by Django itself, so sweep them in
+    # bulk on a schedule rather than letting the table grow without bound.
+    call_command('clearsessions')
+
+
 @app.task(time_limit=120)
 def complete_vm(vm):
     # Hook task for post provisioning cleanup
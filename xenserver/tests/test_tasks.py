@@ -2,6 +2,12 @@
 Some quick and dirty tests for a very small subset of the code.
 """
 
+from datetime import timedelta
+
+from django.contrib.sessions.models import Session
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 import pytest
 from testtools.assertions import assert_that
 from testtools.matchers import MatchesSetwise
@@ -190,6 +196,50 @@ class TestUpdateVms(object):
         apply_task(tasks.updateVms)
         assert sorted(us_calls) == ['xs01.local', 'xs02.local', 'xs03.local']
 
+    def test_servers_have_zone(self, xs_helper, task_catcher):
+        """
+        Servers are passed to updateServer with their zone already loaded.
+        """
+        xs_helper.new_host('xs01.local')
+        xs_helper.new_host('xs02.local')
+        us_calls = task_catcher.catch_async(
+            tasks.updateServer, lambda args, kwargs: args[0])
+        apply_task(tasks.updateVms)
+        with CaptureQueriesContext(connection) as ctx:
+            zones = [server.zone.name for server in us_calls]
+        assert zones == ['zone1', 'zone1']
+        assert len(ctx) == 0
+
+
+@pytest.mark.django_db
+class TestClearSessions(object):
+    """
+    Test xenserver.tasks.clearSessions task.
+    """
+
+    def make_session(self, key, expire_seconds):
+        return Session.objects.create(
+            session_key=key, session_data='',
+            expire_date=timezone.now() + timedelta(seconds=expire_seconds))
+
+    def test_no_sessions(self):
+        """
+        Nothing to do if we have no sessions.
+        """
+        apply_task(tasks.clearSessions)
+        assert list(Session.objects.all()) == []
+
+    def test_expired_sessions(self):
+        """
+        Expired sessions are removed and unexpired sessions are kept.
+        """
+        self.make_session('expired01', -10)
+        self.make_session('expired02', -20)
+        self.make_session('live01', 10)
+        apply_task(tasks.clearSessions)
+        keys = Session.objects.values_list('session_key', flat=True)
+        assert list(keys) == ['live01']
+
 
 def no_urlopen(url):
     raise NotImplementedError('urllib2.urlopen() excised for tests.')
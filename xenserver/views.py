@@ -630,12 +630,10 @@ def provision(request):
 
             # Server autoselect
             if not server:
+                servers = XenServer.objects.with_zone().filter(active=True)
                 if zone:
-                    servers = XenServer.objects.filter(
-                        zone=zone, active=True).order_by('hostname')
-                else:
-                    servers = XenServer.objects.filter(
-                        active=True).order_by('hostname')
+                    servers = servers.filter(zone=zone)
+                servers = servers.order_by('hostname')
 
                 slots = {}
 